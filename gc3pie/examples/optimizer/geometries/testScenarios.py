@@ -34,6 +34,12 @@ __docformat__ = 'reStructuredText'
 import re	
 import os.path
 import gc3libs
+
+
+def _strip_pattern(pattern):
+	"""Remove blanks and double quotes from a test pattern."""
+	return pattern.replace(' ', '').replace('"', '')
+
 #This class will be used to store the patterns logic. 
 # Each pattern is assigned to a file. Each file can have multiple patterns. 
 
@@ -54,6 +60,7 @@ class Test(object):
 	def __init__(self, name):
 		self.name = name #file name, such as exam01.log
 		self.DEBUG = False
+		self._lines = {} #file name -> lines read from it, see read_lines
 	    #Predefined tolerances
 
 		self.tolC =  0.3
@@ -143,24 +150,30 @@ class Test(object):
 			which = 0 
 		return which
 			
+#Return the lines of the file; each file is read only ONCE, even if several steps of a test need it.
+	def read_lines(self, filename):
+		if filename not in self._lines:
+			with open(filename, 'r') as FILE:
+				self._lines[filename] = FILE.readlines()
+		return self._lines[filename]
+
 #Search for pattern in the file. Return a list of lines together with the line numbers. 
 	def grep_file(self, filename, pattern, whichFollowing = 0):
 		regexp = re.compile(pattern, re.VERBOSE) #  
-		FILE = open(filename, 'r')
-		lines = FILE.readlines()
-		FILE.close()
+		lines = self.read_lines(filename)
 		#Store line numbers that match regexp
 		matchedLineNumbers = []
 		matchedLinesTemp = []
-		lenLines = len(lines)
 
-		#Enumerate the lines
+		#Enumerate the lines; the cheap substring test for the
+		#"ggamess test" directives comes first, so those lines never
+		#reach the (slower) regexp search
 		for num, line in enumerate(lines):
-			match = regexp.search(line.strip())
-			if match:
-				if line.find("ggamess test") <= 0:
-					matchedLineNumbers.append(num)
-					matchedLinesTemp.append(line)
+			if line.find("ggamess test") > 0:
+				continue
+			if regexp.search(line.strip()):
+				matchedLineNumbers.append(num)
+				matchedLinesTemp.append(line)
 		return (matchedLineNumbers,matchedLinesTemp)
 		 
  
@@ -293,7 +306,7 @@ If regex extracts many lines the user has a chance to specify which one to selec
 class TestNextLine(Test):
 
 	def grepAndFollow(self, pattern, matchedLinePosition, followingLinePosition, positionInLine, value, tol, name):
-		pattern = re.sub(r"[ \"]", r"", pattern) 
+		pattern = _strip_pattern(pattern)
 
 		self.LPattern = pattern                    	
 		self.LMatchedLine = matchedLinePosition 
@@ -305,9 +318,7 @@ class TestNextLine(Test):
 
 	#Extract num+whichFollowing line number from the file. 
 	def grep_next(self, filename, num, whichFollowing):	
-		FILE = open(filename, 'r')
-		lines = FILE.readlines()
-		FILE.close()
+		lines = self.read_lines(filename)
 		lenLines = len(lines)
 		if (whichFollowing > 0 ): 
 			sum = whichFollowing+num
@@ -321,7 +332,7 @@ class TestNextLine(Test):
 
 class TestLine(Test):	
 	def grepLinesAndAnalyze(self, pattern, matchedLinePosition, positionInLine, value, tol, name):
-		pattern = re.sub(r"[ \"]", r"", pattern) 
+		pattern = _strip_pattern(pattern)
 		self.LPattern = pattern                    	
 		self.LMatchedLine = matchedLinePosition 
 		self.LFollowingLine = None 
@@ -332,7 +343,7 @@ class TestLine(Test):
 
 class Extract(Test):
 	def setup_params(self,pattern, matchedLinePosition, positionInLine):
-		pattern = re.sub(r"[ \"]", r"", pattern) 
+		pattern = _strip_pattern(pattern)
 		self.LPattern = pattern                    	
 		self.LMatchedLine = matchedLinePosition 
 		self.LPositionInLine = positionInLine
@@ -114,22 +114,26 @@ of newly-created jobs so that this limit is never exceeded.
                 apppot_changes = self.params.apppot
             else:
                 apppot_img = self.params.apppot
+        # the application class and keyword arguments are the same
+        # for all tasks: compute them only once
+        common_kwargs = extra.copy()
+        common_kwargs['verno'] = self.params.verno
+        if self.params.extbas is not None:
+            common_kwargs['extbas'] = self.params.extbas
+        if use_apppot:
+            if apppot_img is not None:
+                common_kwargs['apppot_img'] = apppot_img
+            if apppot_changes is not None:
+                common_kwargs['apppot_changes'] = apppot_changes
+            cls = GamessAppPotApplication
+        else:
+            cls = GamessApplication
         # create tasks
         inputs = self._search_for_input_files(self.params.args)
         for path in inputs:
             parameters = [ path ]
-            kwargs = extra.copy()
-            kwargs['verno'] = self.params.verno
-            if self.params.extbas is not None:
-                kwargs['extbas'] = self.params.extbas
-            if use_apppot:
-                if apppot_img is not None:
-                    kwargs['apppot_img'] = apppot_img
-                if apppot_changes is not None:
-                    kwargs['apppot_changes'] = apppot_changes
-                cls = GamessAppPotApplication
-            else:
-                cls = GamessApplication
+            # each task needs its own copy, as `process_args` adds to it
+            kwargs = common_kwargs.copy()
             # construct GAMESS job
             yield (
                 # job name
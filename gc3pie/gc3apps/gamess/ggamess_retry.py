@@ -72,21 +72,21 @@ class GamessRetryPolicy(RetryableTask):
         if not os.path.exists(gamess_out):
             # no output, try again and hope for the best
             return True
-        gamess_outfile = open(gamess_out, 'r')
-        for line in gamess_outfile:
-            if "gracefully" in line:
-                # all OK
-                return False
-            if "ddikick.x: Timed out" in line:
-                # try again
-                return True
-            if "Failed creating" in line:
-                # try again
-                return True
-            if "I/O ERROR" in line:
-                # try spreading over more cores and resubmit
-                gamess.requested_cores *= 2
-                return True
+        with open(gamess_out, 'r') as gamess_outfile:
+            for line in gamess_outfile:
+                if "gracefully" in line:
+                    # all OK
+                    return False
+                if "ddikick.x: Timed out" in line:
+                    # try again
+                    return True
+                if "Failed creating" in line:
+                    # try again
+                    return True
+                if "I/O ERROR" in line:
+                    # try spreading over more cores and resubmit
+                    gamess.requested_cores *= 2
+                    return True
 
 
 
@@ -422,10 +422,12 @@ class JobCollection(dict):
         argument can be any file-like object suitable for passing to
         Python's standard library `csv.DictWriter`.
         """
+        writer = csv.DictWriter(session,
+                                ['id', 'jobid', 'state', 'info', 'history'],
+                                extrasaction='ignore')
         for job in self.values():
             job.history = str.join("; ", job.log)
-            csv.DictWriter(session, ['id', 'jobid', 'state', 'info', 'history'],
-                           extrasaction='ignore').writerow(job)
+            writer.writerow(job)
 
     def stats(self):
         """
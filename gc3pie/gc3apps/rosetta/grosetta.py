@@ -167,10 +167,9 @@ Note: the list of INPUT and OUTPUT files must be separated by ':'
 
     def new_tasks(self, extra):
         ## compute number of decoys already being computed in this session
-        decoys = 0
-        for task in self.session:
-            start, end = task.jobname.split('--')
-            decoys += int(end) - int(start)
+        decoys = sum(int(end) - int(start)
+                     for start, end in (task.jobname.split('--', 1)
+                                        for task in self.session))
         self.log.debug("Total no. of decoys already scheduled for computation: %d", decoys)
 
         # add jobs to the session, until we are computing the specified number of decoys
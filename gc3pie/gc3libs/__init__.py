@@ -1265,7 +1265,7 @@ class Application(Task):
                 def output_url(l, r):
                     if l.scheme == 'file':
                         return os.path.join(self.output_base_url,
-                                            gc3libs.utils.ifelse(l, l, r))
+                                            l if l else r)
                     else:
                         return l
 
@@ -151,6 +151,10 @@ class GamessApplication(gc3libs.Application):
                               " off output file '%s' ..." % output_filename)
             output_file = open(output_filename, 'r')
             for line in output_file:
+                # GAMESS output files can be large: skip the regexp
+                # search on lines that cannot possibly match
+                if 'GAMESS' not in line and 'ddikick' not in line:
+                    continue
                 match = self._termination_re.search(line)
                 if match:
                     if match.group('gamess_outcome'):
@@ -103,17 +103,21 @@ class Auth(object):
           cached instance is returned.
 
         """
-        if auth_name not in self.__auths:
+        try:
+            a = self.__auths[auth_name]
+        except KeyError:
             try:
                 params = self._config[auth_name].copy()
                 params.update(kwargs)
-                a = self._ctors[auth_name](**dict(params))
+                a = self._ctors[auth_name](**params)
             except (AssertionError, AttributeError) as ex:
                 a = gc3libs.exceptions.ConfigurationError(
                     "Missing required configuration parameters"
                     " in auth section '%s': %s" % (auth_name, str(ex)))
         else:
-            a = self.__auths[auth_name]
+            if type(a) is NoneAuth:
+                # always valid, no need to check it again
+                return a
 
         if isinstance(a, Exception):
             if isinstance(a, gc3libs.exceptions.UnrecoverableError):
@@ -289,10 +289,8 @@ class GridAuth(object):
                 "Temporary failure in enabling Grid authentication."
                 " Grid/VOMS proxy is %s."
                 " User certificate is %s."
-                % (gc3libs.utils.ifelse(self.proxy_valid,
-                                        "valid", "invalid"),
-                   gc3libs.utils.ifelse(self.user_cert_valid,
-                                        "valid", "invalid")))
+                % ("valid" if self.proxy_valid else "invalid",
+                   "valid" if self.user_cert_valid else "invalid"))
         return True
 
     def renew_cert(self, shib_passwd, key_passwd):
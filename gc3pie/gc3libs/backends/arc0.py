@@ -33,8 +33,7 @@ from gc3libs import log, Run
 from gc3libs.backends import LRMS
 import gc3libs.exceptions
 from gc3libs.quantity import kB, MB, seconds
-from gc3libs.utils import (cache_for, same_docstring_as, movetree, tempdir,
-                           ifelse)
+from gc3libs.utils import cache_for, same_docstring_as, movetree, tempdir
 
 # this is where arc0 libraries are installed from release 11.05
 sys.path.append('/usr/lib/pymodules/python%d.%d/'
@@ -464,25 +463,18 @@ class ArcLrms(LRMS):
         job.lrms_jobname = arc_job.job_name  # see Issue #78
 
         # Common struture as described in Issue #78
-        job.duration = ifelse(
-            arc_job.used_wall_time != -1,
-            arc_job.used_wall_time * seconds,
-            None)
-        job.max_used_memory = ifelse(
-            arc_job.used_memory != -1,
-            arc_job.used_memory * kB,
-            None)
-        job.used_cpu_time = ifelse(
-            arc_job.used_cpu_time != -1,
-            arc_job.used_cpu_time * seconds,
-            None)
+        job.duration = (arc_job.used_wall_time * seconds
+                        if arc_job.used_wall_time != -1 else None)
+        job.max_used_memory = (arc_job.used_memory * kB
+                               if arc_job.used_memory != -1 else None)
+        job.used_cpu_time = (arc_job.used_cpu_time * seconds
+                             if arc_job.used_cpu_time != -1 else None)
 
         # additional info
-        job.cores = gc3libs.utils.ifelse(
-            arc_job.cpu_count != -1, arc_job.cpu_count, None)
+        job.cores = (arc_job.cpu_count
+                     if arc_job.cpu_count != -1 else None)
         job.arc_original_exitcode = arc_job.exitcode
-        job.arc_queue = gc3libs.utils.ifelse(
-            arc_job.queue != '', arc_job.queue, None)
+        job.arc_queue = arc_job.queue if arc_job.queue != '' else None
 
         job.state = state
         return state
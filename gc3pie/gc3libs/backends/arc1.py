@@ -42,7 +42,7 @@ from gc3libs.backends import LRMS
 import gc3libs.exceptions
 from gc3libs.quantity import kB, MB, seconds
 from gc3libs.utils import (cache_for, same_docstring_as,
-                           movetree, tempdir, ifelse)
+                           movetree, tempdir)
 import gc3libs.url
 
 
@@ -479,16 +479,12 @@ class Arc1Lrms(LRMS):
             # pass
 
         # common job reporting info, see Issue #78 and `Task.update_state`
-        job.duration = ifelse(arc_job.UsedTotalWallTime.GetPeriod() != -1,
-                              arc_job.UsedTotalWallTime.GetPeriod() * seconds,
-                              None)
-        job.max_used_memory = ifelse(arc_job.UsedMainMemory != -1,
-                                     arc_job.UsedMainMemory * kB,
-                                     None)
-        job.used_cpu_time = ifelse(
-            arc_job.UsedTotalCPUTime.GetPeriod() != -1,
-            arc_job.UsedTotalCPUTime.GetPeriod() * seconds,
-            None)
+        wall_time = arc_job.UsedTotalWallTime.GetPeriod()
+        job.duration = (wall_time * seconds if wall_time != -1 else None)
+        job.max_used_memory = (arc_job.UsedMainMemory * kB
+                               if arc_job.UsedMainMemory != -1 else None)
+        cpu_time = arc_job.UsedTotalCPUTime.GetPeriod()
+        job.used_cpu_time = (cpu_time * seconds if cpu_time != -1 else None)
 
         # additional info
         job.arc_original_exitcode = arc_job.ExitCode
@@ -42,11 +42,15 @@ __docformat__ = 'reStructuredText'
 
 
 # stdlib modules
+import datetime
 import fnmatch
+import itertools
 import logging
 import math
 import os
 import os.path
+import re
+import stat
 import sys
 from prettytable import PrettyTable
 import time
@@ -55,6 +59,12 @@ import time
 import cli  # pyCLI
 import cli.app
 import cli._ext.argparse as argparse
+try:
+    # `scandir.walk` is a drop-in replacement for `os.walk` that
+    # avoids one `stat()` call per directory entry
+    from scandir import walk
+except ImportError:
+    from os import walk
 
 # interface to Gc3libs
 import gc3libs
@@ -69,6 +79,10 @@ from gc3libs.quantity import Memory, GB, Duration, hours
 from gc3libs.session import Session
 
 
+# placeholders substituted by `SessionBasedScript.make_directory_path`
+_PATHSPEC_PLACEHOLDER_RE = re.compile(r'SESSION|NAME|DATE|TIME')
+
+
 # types for command-line parsing; see
 # http://docs.python.org/dev/library/argparse.html#type
 
@@ -801,12 +815,20 @@ class SessionBasedScript(_Script):
           * ``DATE`` is replaced with the current date, in *YYYY-MM-DD* format;
           * ``TIME`` is replaced with the current time, in *HH:MM* format.
 
+        All substitutions are done in a single pass, so placeholders
+        occurring in the substituted values are not expanded again.
         """
-        return (pathspec
-                .replace('SESSION', self.params.session + '.out')
-                .replace('NAME', jobname)
-                .replace('DATE', time.strftime('%Y-%m-%d'))
-                .replace('TIME', time.strftime('%H:%M')))
+        values = {
+            'SESSION': self.params.session + '.out',
+            'NAME': jobname,
+        }
+        # only format the current date/time if it is actually needed
+        if 'DATE' in pathspec or 'TIME' in pathspec:
+            now = datetime.datetime.now()
+            values['DATE'] = now.date().isoformat()
+            values['TIME'] = '%02d:%02d' % (now.hour, now.minute)
+        return _PATHSPEC_PLACEHOLDER_RE.sub(
+            lambda match: values[match.group(0)], pathspec)
 
     def process_args(self):
         """
@@ -822,7 +844,8 @@ class SessionBasedScript(_Script):
 
         The default implementation calls `new_tasks`:meth: and adds to
         the session all jobs whose name does not clash with the
-        jobname of an already existing task.
+        jobname of an already existing task, or of a task added
+        earlier on by the same invocation.
 
         See also: `new_tasks`:meth:
         """
@@ -839,17 +862,9 @@ class SessionBasedScript(_Script):
                 self.params.output,
                 'NAME'))
 
-        # build job list
-        new_jobs = list(self.new_tasks(self.extra.copy()))
-        # pre-allocate Job IDs
-        if len(new_jobs) > 0:
-            # XXX: can't we just make `reserve` part of the `IdFactory`
-            # contract?
-            try:
-                self.session.store.idfactory.reserve(len(new_jobs))
-            except AttributeError:
-                # no `idfactory`, ignore
-                pass
+        # build job list; consume it in batches so that Job IDs can be
+        # pre-allocated without holding all the new jobs in memory
+        new_jobs = self._reserve_ids_for(self.new_tasks(self.extra.copy()))
 
         # add new jobs to the session
         existing_job_names = self.session.list_names()
@@ -910,7 +925,28 @@ class SessionBasedScript(_Script):
 
             # all done, append to session
             self.session.add(task, flush=False)
-            self.log.debug("Added task '%s' to session." % task.jobname)
+            existing_job_names.add(task.jobname)
+            self.log.debug("Added task '%s' to session.", task.jobname)
+
+    def _reserve_ids_for(self, items, batch_size=1000):
+        """
+        Iterate over `items`, pre-allocating Job IDs in the session
+        store for each batch of (at most) `batch_size` items.
+        """
+        items = iter(items)
+        while True:
+            batch = list(itertools.islice(items, batch_size))
+            if not batch:
+                break
+            # XXX: can't we just make `reserve` part of the `IdFactory`
+            # contract?
+            try:
+                self.session.store.idfactory.reserve(len(batch))
+            except AttributeError:
+                # no `idfactory`, ignore
+                pass
+            for item in batch:
+                yield item
 
     def _fix_output_dir(self, task, name):
         """Substitute the NAME string in output paths."""
@@ -962,26 +998,27 @@ class SessionBasedScript(_Script):
         """
         inputs = self._search_for_input_files(self.params.args)
 
+        # each job gets its own copy of `extra`, as `process_args`
+        # fills in defaults by mutating it
         for path in inputs:
+            name = gc3libs.utils.basename_sans(path)
             if self.instances_per_file > 1:
-                for seqno in range(1,
-                                   1 + self.instances_per_file,
-                                   self.instances_per_job):
+                for seqno in xrange(1,
+                                    1 + self.instances_per_file,
+                                    self.instances_per_job):
                     if self.instances_per_job > 1:
                         yield (
                             "%s.%d--%s" % (
-                                gc3libs.utils.basename_sans(path),
+                                name,
                                 seqno,
                                 min(seqno + self.instances_per_job - 1,
                                     self.instances_per_file)),
                             self.application, [path], extra.copy())
                     else:
-                        yield ("%s.%d" % (gc3libs.utils.basename_sans(path),
-                                          seqno),
+                        yield ("%s.%d" % (name, seqno),
                                self.application, [path], extra.copy())
             else:
-                yield (gc3libs.utils.basename_sans(path),
-                       self.application, [path], extra.copy())
+                yield (name, self.application, [path], extra.copy())
 
     def make_task_controller(self):
         """
@@ -1025,11 +1062,18 @@ class SessionBasedScript(_Script):
         description.
 
         """
-        table = PrettyTable(['state', 'n', 'n%'])
-        table.align = 'r'
-        table.align['n%'] = 'c'
-        table.border = False
-        table.header = False
+        # the table layout does not change across main loop
+        # iterations, so set it up once and just refill its rows
+        table = self._summary_table
+        if table is None:
+            table = PrettyTable(['state', 'n', 'n%'])
+            table.align = 'r'
+            table.align['n%'] = 'c'
+            table.border = False
+            table.header = False
+            self._summary_table = table
+        else:
+            table.clear_rows()
         total = stats['total']
         # ensure we display enough decimal digits in percentages when
         # running a large number of jobs; see Issue 308 for a more
@@ -1069,17 +1113,21 @@ class SessionBasedScript(_Script):
         :param   only: Root class (or tuple of root classes) of tasks to
                        consider.
         """
+        rows = [[task.persistent_id, task.jobname,
+                 task.execution.state, task.execution.info]
+                for task in self.session
+                if isinstance(task, only)
+                and task.execution.in_state(*states)]
+        if not rows:
+            # nothing to print
+            return
+
         table = PrettyTable(['JobID', 'Job name', 'State', 'Info'])
         table.align = 'l'
-        for task in self.session:
-            if isinstance(task, only) and task.execution.in_state(*states):
-                table.add_row([task.persistent_id, task.jobname,
-                               task.execution.state, task.execution.info])
-
-        # XXX: uses prettytable's internal implementation detail
-        if len(table._rows) > 0:
-            output.write(str(table))
-            output.write("\n")
+        for row in rows:
+            table.add_row(row)
+        output.write(str(table))
+        output.write("\n")
 
     def before_main_loop(self):
         """
@@ -1165,6 +1213,8 @@ class SessionBasedScript(_Script):
         self.session = None
         # by default, print stats of all kind of jobs
         self.stats_only_for = None
+        # table used by `print_summary_table`; created on first use
+        self._summary_table = None
         self.instances_per_file = 1
         self.instances_per_job = 1
         self.extra = {}  # extra extra_args arguments passed to `parse_args`
@@ -1561,14 +1611,15 @@ class SessionBasedScript(_Script):
         Override this method if you need to alter the termination
         condition for a `SessionBasedScript`.
         """
+        State = gc3libs.Run.State
         rc = 0
         if stats['failed'] > 0:
             rc |= 2
-        if stats[gc3libs.Run.State.RUNNING] > 0 \
-                or stats[gc3libs.Run.State.SUBMITTED] > 0 \
-                or stats[gc3libs.Run.State.UNKNOWN]:
+        if (stats[State.RUNNING] > 0
+                or stats[State.SUBMITTED] > 0
+                or stats[State.UNKNOWN]):
             rc |= 4
-        if stats[gc3libs.Run.State.NEW] > 0:
+        if stats[State.NEW] > 0:
             rc |= 8
         return rc
 
@@ -1594,31 +1645,50 @@ class SessionBasedScript(_Script):
                 if '*' in ext or '?' in ext or '[' in ext:
                     ext = None
 
-        def matches(name):
-            return (fnmatch.fnmatch(os.path.basename(name), pattern)
-                    or fnmatch.fnmatch(name, pattern))
+        if ext is not None:
+            # a plain suffix check is all that is needed for '*.ext'
+            def matches(name):
+                return name.endswith(ext)
+        else:
+            # translate the glob pattern into a regexp only once
+            match = re.compile(fnmatch.translate(pattern)).match
+            basename = os.path.basename
+
+            def matches(name):
+                return (match(basename(name)) is not None
+                        or match(name) is not None)
+
+        # local aliases, for use in the inner loop below
+        join = os.path.join
+        debug = self.log.debug
         for path in paths:
-            self.log.debug("Now processing input path '%s' ..." % path)
-            if os.path.isdir(path):
+            self.log.debug("Now processing input path '%s' ...", path)
+            # a single `stat()` tells both if `path` exists and if
+            # it is a directory
+            try:
+                path_mode = os.stat(path).st_mode
+            except OSError:
+                path_mode = None
+            if path_mode is not None and stat.S_ISDIR(path_mode):
                 # recursively scan for input files
-                for dirpath, dirnames, filenames in os.walk(path):
+                for dirpath, dirnames, filenames in walk(path):
                     for filename in filenames:
                         if matches(filename):
-                            pathname = os.path.join(dirpath, filename)
-                            self.log.debug("Path '%s' matches pattern '%s',"
-                                           " adding it to input list"
-                                           % (pathname, pattern))
+                            pathname = join(dirpath, filename)
+                            debug("Path '%s' matches pattern '%s',"
+                                  " adding it to input list",
+                                  pathname, pattern)
                             inputs.add(pathname)
-            elif matches(path) and os.path.exists(path):
+            elif path_mode is not None and matches(path):
                 self.log.debug("Path '%s' matches pattern '%s',"
-                               " adding it to input list" % (path, pattern))
+                               " adding it to input list", path, pattern)
                 inputs.add(path)
             elif ext is not None \
                     and not path.endswith(ext) \
                     and os.path.exists(path + ext):
                 self.log.debug("Path '%s' matched extension '%s',"
-                               " adding to input list"
-                               % (path + ext, ext))
+                               " adding to input list",
+                               path + ext, ext)
                 inputs.add(os.path.realpath(path + ext))
             else:
                 self.log.error(
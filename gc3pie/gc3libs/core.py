@@ -41,6 +41,12 @@ import gc3libs.exceptions
 import gc3libs.utils as utils
 
 
+# states in which `Engine` keeps a task in its "in flight" queue
+_IN_FLIGHT_STATES = frozenset([Run.State.SUBMITTED,
+                               Run.State.RUNNING,
+                               Run.State.UNKNOWN])
+
+
 class MatchMaker(object):
 
     """Select and sort resources for attempting submission of a `Task`.
@@ -1195,9 +1201,7 @@ class Engine(object):
         state = task.execution.state
         if Run.State.NEW == state:
             queue = self._new
-        elif state in [Run.State.SUBMITTED,
-                       Run.State.RUNNING,
-                       Run.State.UNKNOWN]:
+        elif state in _IN_FLIGHT_STATES:
             queue = self._in_flight
         elif Run.State.STOPPED == state:
             queue = self._stopped
@@ -1416,10 +1420,10 @@ class Engine(object):
                 if self._store and task.changed:
                     self._store.save(task)
                 state = task.execution.state
-                if state in [Run.State.SUBMITTED, Run.State.RUNNING]:
+                if state == Run.State.SUBMITTED or state == Run.State.RUNNING:
                     if isinstance(task, Application):
                         currently_in_flight += 1
-                        if task.execution.state == Run.State.SUBMITTED:
+                        if state == Run.State.SUBMITTED:
                             currently_submitted += 1
                     self._in_flight.append(task)
                     # task changed state, mark as to remove
@@ -1629,45 +1633,24 @@ class Engine(object):
             gc3libs.log.debug(
                 "Engine.stats: Restricting to object of class '%s'",
                 only.__name__)
-        result = defaultdict(lambda: 0)
-        if only:
-            result[Run.State.NEW] = len([task for task in self._new
-                                         if isinstance(task, only)])
+
+            def keep(tasks):
+                return [task for task in tasks if isinstance(task, only)]
         else:
-            result[Run.State.NEW] = len(self._new)
-        for task in self._in_flight:
-            if only and not isinstance(task, only):
-                continue
-            state = task.execution.state
-            result[state] += 1
-        for task in self._stopped:
-            if only and not isinstance(task, only):
-                continue
-            state = task.execution.state
-            result[state] += 1
-        for task in self._to_kill:
-            if only and not isinstance(task, only):
-                continue
+            def keep(tasks):
+                return tasks
+        result = defaultdict(lambda: 0)
+        result[Run.State.NEW] = len(keep(self._new))
+        for tasks in self._in_flight, self._stopped, self._to_kill:
             # XXX: presumes no task in the `_to_kill` list is TERMINATED
-            state = task.execution.state
-            result[state] += 1
-        if only:
-            _terminating = [task for task in self._terminating
-                            if isinstance(task, only)]
-            result[Run.State.TERMINATING] += len(_terminating)
-        else:
-            result[Run.State.TERMINATING] += len(self._terminating)
-        if only:
-            _terminated = [task for task in self._terminated
-                           if isinstance(task, only)]
-            result[Run.State.TERMINATED] += len(_terminated)
-        else:
-            result[Run.State.TERMINATED] += len(self._terminated)
+            for task in keep(tasks):
+                result[task.execution.state] += 1
+        result[Run.State.TERMINATING] += len(keep(self._terminating))
+        terminated = keep(self._terminated)
+        result[Run.State.TERMINATED] += len(terminated)
 
         # for TERMINATED tasks, compute the number of successes/failures
-        for task in self._terminated:
-            if only and not isinstance(task, only):
-                continue
+        for task in terminated:
             if task.execution.returncode == 0:
                 result['ok'] += 1
             else:
@@ -152,9 +152,14 @@ class EvolutionaryAlgorithm(object):
                 self.best_y,
                 self.y_conv_crit)
 
-        # Check `dx_conv_crit`
-        dxs = np.abs(self.pop[:, :] - self.pop[0, :])
-        has_dx_converged = (dxs <= self.dx_conv_crit).all()
+        # Check `dx_conv_crit`: the largest distance from the first
+        # member along each axis is attained at the column-wise max or
+        # min, so there is no need to build the full matrix of distances
+        x0 = self.pop[0, :]
+        has_dx_converged = (
+            self.dx_conv_crit is not None
+            and (self.pop.max(axis=0) - x0 <= self.dx_conv_crit).all()
+            and (x0 - self.pop.min(axis=0) <= self.dx_conv_crit).all())
         if has_dx_converged:
             converged = True
             self.logger.info(
@@ -179,8 +184,7 @@ class EvolutionaryAlgorithm(object):
         # populations...  You might want to
         # `np.set_printoptions(linewidth=1024)` or so to prevent this.
         self.logger.debug(
-            'Updating optimizer state with new values: %s',
-            str(new_vals))
+            'Updating optimizer state with new values: %s', new_vals)
 
         # In variable names `best` refers to a population member with the
         # lowest target function value within some group:
@@ -193,9 +197,10 @@ class EvolutionaryAlgorithm(object):
         # determine the member with the lowest target value
         best_ix = np.argmin(new_vals)
         if self.cur_iter == 0 or new_vals[best_ix] < self.best_y:
-            # store the best population members
+            # store the best population members; `best_x` must be copied
+            # as it is a view into `new_pop`, while `best_y` is a scalar
             self.best_x = new_pop[best_ix, :].copy()
-            self.best_y = new_vals[best_ix].copy()
+            self.best_y = float(new_vals[best_ix])
 
         if self.cur_iter > 0:
             # update self.pop and self.vals
@@ -242,8 +247,8 @@ def populate(create_fn, in_domain=None, max_n_resample=100):
 
     :param fun create_fn: Generates a new population. Takes no arguments.
     :param fun in_domain: Determines population's validity.
-                          Takes no arguments and returns a list of bools
-                          indicating each members validity.
+                          Takes the whole population and returns a list
+                          or array of bools indicating each members validity.
     :param int max_n_resample: Maximum number of resamples to be drawn to
                                satisfy :func:`in_domain
 
@@ -251,16 +256,19 @@ def populate(create_fn, in_domain=None, max_n_resample=100):
     '''
     pop = create_fn()
     if in_domain:
+        pop_invalid_orig = ~np.asarray(in_domain(pop), dtype=bool)
+        n_invalid_orig = pop_invalid_orig.sum()
+        if n_invalid_orig == 0:
+            # all members valid, no need to re-evolve
+            return pop
         # re-evolve if some members do not fullfill fiter_fn
-        pop_valid_orig = np.array(in_domain(pop))
-        n_invalid_orig = (~pop_valid_orig).sum()
-        fillin_pop = pop[~pop_valid_orig]
+        fillin_pop = pop[pop_invalid_orig]
         n_to_fill = len(fillin_pop)
         total_filled = 0
         ctr = 0
         while total_filled < n_invalid_orig and ctr < max_n_resample:
             new_pop = create_fn()
-            new_pop_valid = np.array(in_domain(new_pop))
+            new_pop_valid = np.asarray(in_domain(new_pop))
             n_pop_valid = new_pop_valid.sum()
             new_total_filled = min(total_filled + n_pop_valid, n_to_fill)
             n_new_recruits = new_total_filled - total_filled
@@ -268,13 +276,14 @@ def populate(create_fn, in_domain=None, max_n_resample=100):
             fillin_pop[
                 total_filled:new_total_filled] = new_pop[ix_new_recruits]
             total_filled = new_total_filled
+            ctr += 1
         if total_filled < n_invalid_orig:
-            self.logger.warning(
+            gc3libs.log.warning(
                 "%d population members are invalid even after re-sampling %d times."
                 "  You might want to increase `max_n_resample`.",
                 (n_invalid_orig - total_filled),
                 max_n_resample)
-        pop[~pop_valid_orig] = fillin_pop
+        pop[pop_invalid_orig] = fillin_pop
     return pop
 
 
@@ -293,13 +302,16 @@ def draw_population(
     :param int dim: Dimension of each population member.
     :param int size: Population size.
     :param fun in_domain: Determines population's validity.
-                          Takes no arguments and returns a list of bools
-                          indicating each members validity.
-    :param float `seed`: Seed to initialize NumPy's random number generator.
+                          Takes the whole population and returns a list
+                          or array of bools indicating each members validity.
+    :param float `seed`: Seed to initialize the random number generator used for the draw.
     :rtype: list of population members
     '''
-    np.random.seed(seed)
-    return populate(create_fn=lambda: (lower_bds +
-                                       np.random.random_sample((size, dim)) *
-                                       (upper_bds -
-                                        lower_bds)), in_domain=in_domain)
+    rng = np.random.RandomState(seed)
+    # `populate` may call `create_fn` many times: compute these only once
+    lower_bds = np.asarray(lower_bds, dtype=float)
+    bds_range = np.asarray(upper_bds, dtype=float) - lower_bds
+    shape = (size, dim)
+    return populate(
+        create_fn=lambda: lower_bds + rng.random_sample(shape) * bds_range,
+        in_domain=in_domain)
@@ -85,7 +85,7 @@ class DifferentialEvolutionAlgorithm(EvolutionaryAlgorithm):
     :param float `dx_conv_crit`: Abort optimization if all population members are within a certain distance to each other.
     :param float `y_conv_crit`: Declare convergence when the target function is below a `y_conv_crit`.
     :param fun `in_domain`: Optional function that implements nonlinear constraints.
-    :param float `seed`: Seed to initialize NumPy's random number generator.
+    :param float `seed`: Seed to initialize this instance's random number generator.
     :param obj `logger`: Configured logger to use.
     :param list `after_update_opt_state`: Functions that are called at the end of
                 `DifferentialEvolutionAlgorithm.after_update_opt_state`:meth:. Use this list
@@ -139,11 +139,12 @@ class DifferentialEvolutionAlgorithm(EvolutionaryAlgorithm):
         else:
             self.in_domain = in_domain
 
-        # initialize NumPy's RNG
-        np.random.seed(seed)
+        # use a private RNG, so that other users of NumPy's global
+        # random state do not interfere with (or reseed) this one
+        self.rng = np.random.RandomState(seed)
 
-    def _default_in_domain(self, x):
-        return np.array([True] * self.pop_size)
+    def _default_in_domain(self, pop):
+        return np.ones(len(pop), dtype=bool)
 
     def select(self, new_pop, new_vals):
         '''
@@ -151,8 +152,9 @@ class DifferentialEvolutionAlgorithm(EvolutionaryAlgorithm):
         with lowest corresponding value.
         '''
         ix_superior = new_vals < self.vals
-        self.pop[ix_superior, :] = new_pop[ix_superior, :].copy()
-        self.vals[ix_superior] = new_vals[ix_superior].copy()
+        # boolean indexing already returns copies
+        self.pop[ix_superior, :] = new_pop[ix_superior, :]
+        self.vals[ix_superior] = new_vals[ix_superior]
 
     def evolve(self):
         '''
@@ -169,7 +171,8 @@ class DifferentialEvolutionAlgorithm(EvolutionaryAlgorithm):
                     self.dim,
                     self.best_x,
                     self.de_strategy,
-                    self.exp_cross)),
+                    self.exp_cross,
+                    self.rng)),
             in_domain=self.in_domain)
 
     @staticmethod
@@ -180,7 +183,8 @@ class DifferentialEvolutionAlgorithm(EvolutionaryAlgorithm):
             dim,
             best_iter,
             de_strategy,
-            exp_cross):
+            exp_cross,
+            rng=None):
         """
         Return new population, evolved according to `de_strategy`.
 
@@ -191,125 +195,147 @@ class DifferentialEvolutionAlgorithm(EvolutionaryAlgorithm):
         :param best_iter: Best population member of the current population.
         :param de_strategy: Differential Evolution strategy. See :class:`DifferentialEvolutionAlgorithm`.
         :param exp_cross bool: Set True to use exponential crossover.
+        :param rng: A `numpy.random.RandomState` instance to draw random
+                    numbers from; if `None` (default), use NumPy's
+                    global random state.
         """
 
         assert de_strategy in strategies
 
+        if rng is None:
+            rng = np.random
+
         pop_size = len(population)
 
-        # BJ: Need to add +1 in definition of ind otherwise there is one zero
-        # index that leaves creates no shuffling.
-        # index pointer array. e.g. [2, 1, 4, 3]
-        ind = np.random.permutation(4) + 1
-        rot = np.arange(
-            0,
-            pop_size,
-            1)     # rotating index array (size pop_size)
-        rt = np.zeros(pop_size)            # another rotating index array
-        # index arrays
-        a1 = np.random.permutation(pop_size)   # shuffle locations of vectors
-        a2 = a1[
-            (rot + ind[0]) %
-            pop_size]  # rotate vector locations by ind[0] positions
-        a3 = a2[(rot + ind[1]) % pop_size]
-        a4 = a3[(rot + ind[2]) % pop_size]
-        a5 = a4[(rot + ind[3]) % pop_size]
+        # For each population member, pick three mutually distinct random
+        # members `a1`, `a2`, `a3` to build the differential variation
+        # from.  (The MATLAB original derives them from one permutation
+        # rotated by random offsets; drawing the indices directly is
+        # cheaper.)  Redraw only the columns where some indices collide.
+        if pop_size >= 3:
+            ix = rng.randint(0, pop_size, size=(3, pop_size))
+            while True:
+                clash = (ix[0] == ix[1]) | (ix[0] == ix[2]) | (ix[1] == ix[2])
+                n_clash = clash.sum()
+                if n_clash == 0:
+                    break
+                ix[:, clash] = rng.randint(0, pop_size, size=(3, n_clash))
+            a1, a2, a3 = ix
+        else:
+            # too few members for three distinct parents: use the
+            # MATLAB rotation scheme, where parents may coincide
+            ind = rng.permutation(4) + 1
+            rot = np.arange(pop_size)
+            a1 = rng.permutation(pop_size)
+            a2 = a1[(rot + ind[0]) % pop_size]
+            a3 = a2[(rot + ind[1]) % pop_size]
 
         pm1 = population[a1, :]  # shuffled population matrix 1
         pm2 = population[a2, :]  # shuffled population matrix 2
         pm3 = population[a3, :]  # shuffled population matrix 3
-        pm4 = population[a4, :]  # shuffled population matrix 4
-        pm5 = population[a5, :]  # shuffled population matrix 5
-
-        # "best member" matrix
-        bm = np.zeros((pop_size, dim))   # initialize FVr_bestmember  matrix
-        # population filled with the best member
-        for k in range(pop_size):
-            bm[k, :] = best_iter                       # of the last iteration
 
         # mask for intermediate population
         # all random numbers < prob_crossover are 1, 0 otherwise
-        mui = np.random.random_sample((pop_size, dim)) < prob_crossover
+        mui = rng.random_sample((pop_size, dim)) < prob_crossover
 
         if exp_cross:
-            # rotating index array, i.e. [0, 1, 2, ..., dim]
-            rotd = np.arange(dim)
-            # rotating index array for exponential crossover
-            rtd = np.zeros(dim, dtype=np.int)
             # Prepare intermediate population for indexing.
             mui = np.sort(mui.transpose(), axis=0)
             # Columns are pop members. Put all False indices in the first rows.
-            for k in range(pop_size):
-                n = int(np.floor(np.random.rand() * dim))
-                if n > 0:
-                    # Build actual rotation vector.
-                    rtd = (rotd + n) % dim
-                    # e.g. dim = 6, n = 2 -> [3,2,1,0,1,2]
-                    # Rotate indices for kth population member by n.
-                    mui[:, k] = mui[rtd, k]
-            mui = mui.transpose()
-
-        # inverse mask to mui (mpo + mui == <vector of 1's>)
-        mpo = mui < 0.5
+            # Rotate the indices of the kth population member by a random
+            # amount n[k]: stacking `mui` on top of itself, the rotated
+            # column is the window of length `dim` starting at row n[k],
+            # so build a (read-only) view of all such windows and pick
+            # one per population member.
+            n = np.floor(rng.rand(pop_size) * dim).astype(int)
+            double = np.concatenate((mui, mui), axis=0)
+            windows = np.lib.stride_tricks.as_strided(
+                double,
+                shape=(dim, dim, pop_size),
+                strides=(double.strides[0],) + double.strides)
+            # the windows overlap in memory: forbid writing through them
+            windows.flags.writeable = False
+            # fancy indexing with `n` and `arange` yields a (pop_size, dim)
+            # array, i.e., the rotated mask already transposed back
+            mui = windows[n, :, np.arange(pop_size)]
+
+        # Crossover below picks `ui` where `mui` is True and the old
+        # population elsewhere, in one pass via `np.where` (the MATLAB
+        # original uses an inverse mask `mpo` and two products).
 
         if (de_strategy == 'DE_rand'):
             #origin = pm3
-            ui = pm3 + de_step_size * (pm1 - pm2)   # differential variation
-            ui = population * mpo + ui * mui          # crossover
+            # differential variation, computed in place
+            ui = pm1 - pm2
+            ui *= de_step_size
+            ui += pm3
+            ui = np.where(mui, ui, population)  # crossover
         elif (de_strategy == 'DE_local_to_best'):
             #origin = population
+            # `best_iter` broadcasts against the whole population
             ui = population + de_step_size * \
-                (bm - population) + de_step_size * (pm1 - pm2)
-            ui = population * mpo + ui * mui
+                (best_iter - population) + de_step_size * (pm1 - pm2)
+            ui = np.where(mui, ui, population)
         elif (de_strategy == 'DE_best_with_jitter'):
-            #origin = bm
-            ui = bm + (pm1 - pm2) * ((1 - 0.9999) * \
-                       np.random.random_sample((pop_size, dim)) + de_step_size) 
-            ui = population * mpo + ui * mui
+            #origin = best_iter
+            ui = best_iter + (pm1 - pm2) * ((1 - 0.9999) * \
+                       rng.random_sample((pop_size, dim)) + de_step_size) 
+            ui = np.where(mui, ui, population)
         elif (de_strategy == 'DE_rand_with_per_vector_dither'):
             #origin = pm3
-            f1 = (
-                (1 -
-                 de_step_size) *
-                np.random.random_sample(
-                    (pop_size,
-                     1)) +
-                de_step_size)
-            for k in range(dim):
-                pm5[:, k] = f1
-            ui = pm3 + (pm1 - pm2) * pm5    # differential variation
-            ui = population * mpo + ui * mui     # crossover
+            # one dither factor per population member, as a column
+            # vector that broadcasts over all `dim` components
+            f1 = rng.random_sample((pop_size, 1))
+            f1 *= (1 - de_step_size)
+            f1 += de_step_size
+            # differential variation, computed in place
+            ui = pm1 - pm2
+            ui *= f1
+            ui += pm3
+            ui = np.where(mui, ui, population)  # crossover
         elif (de_strategy == 'DE_rand_with_per_generation_dither'):
             #origin = pm3
             f1 = (
                 (1 -
                  de_step_size) *
-                np.random.random_sample() +
+                rng.random_sample() +
                 de_step_size)
-            ui = pm3 + (pm1 - pm2) * f1         # differential variation
-            ui = population * mpo + ui * mui   # crossover
+            # differential variation, computed in place
+            ui = pm1 - pm2
+            ui *= f1
+            ui += pm3
+            ui = np.where(mui, ui, population)  # crossover
         elif (de_strategy == 'DE_rand_either_or_algorithm'):
             #origin = pm3
             # Pmu = 0.5
-            if (np.random.random_sample() < 0.5):
-                ui = pm3 + de_step_size * (pm1 - pm2)  # differential variation
+            if (rng.random_sample() < 0.5):
+                # differential variation, computed in place
+                ui = pm1 - pm2
+                ui *= de_step_size
+                ui += pm3
             # use F-K-Rule: K = 0.5(F+1)
             else:
                 ui = pm3 + 0.5 * (de_step_size + 1.0) * (pm1 + pm2 - 2 * pm3)
-                ui = population * mpo + ui * mui     # crossover
+                ui = np.where(mui, ui, population)  # crossover
 
         return ui
 
     # Adjustments for pickling
     def __getstate__(self):
         state = self.__dict__.copy()
-        if 'logger' in state.keys():
+        # loggers cannot be pickled; `__setstate__` sets a new one
+        if 'logger' in state:
             del state['logger']
-#        return state
-        return None
+        # neither can bound methods; `__setstate__` restores the default
+        if state.get('in_domain') == self._default_in_domain:
+            del state['in_domain']
+        return state
 
     def __setstate__(self, state):
         self.__dict__ = state
+        self.logger = logging.getLogger('gc3.gc3libs')
+        if 'in_domain' not in state:
+            self.in_domain = self._default_in_domain
 
 
 # Variable changes from matlab implementation
@@ -335,10 +361,10 @@ class DifferentialEvolutionAlgorithm(EvolutionaryAlgorithm):
 # FM_pm3 -> pm3
 # FM_pm4 -> pm4
 # FM_pm5 -> pm5
-# FM_bm  -> bm best member matrix
+# FM_bm  -> best_iter (broadcast instead of a best member matrix)
 # FM_ui  -> ui ??
 # FM_mui -> mui # mask for intermediate population
-# FM_mpo -> mpo # mask for old population
+# FM_mpo -> (not needed: crossover uses `np.where` on `mui`)
 # FVr_rot -> rot  # rotating index array (size I_NP)
 # FVr_rotd -> rotd  # rotating index array (size I_D)
 # FVr_rt -> rt  # another rotating index array
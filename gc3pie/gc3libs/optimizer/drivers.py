@@ -36,6 +36,7 @@ import os
 import sys
 import logging
 import datetime
+import multiprocessing
 
 import numpy as np
 from prettytable import PrettyTable
@@ -66,6 +67,15 @@ class SequentialDriver(object):
                      values at each step of the algorithm. If `None` (default), this verbose
                      report is not generated, as it might be time-consuming for large population
                      sizes.
+
+    :param int n_workers: If greater than 1, split each population
+                          into `n_workers` chunks and evaluate them
+                          in parallel in a pool of as many local
+                          processes. In this case, :func:`target_fn`
+                          must be picklable (e.g., a module-level
+                          function). If `None` (default), the
+                          population is evaluated in the current
+                          process.
     """
 
     def __init__(
@@ -75,7 +85,8 @@ class SequentialDriver(object):
             path_to_stage_dir=os.getcwd(),
             cur_pop_file=None,
             logger=None,
-            fmt=None):
+            fmt=None,
+            n_workers=None):
         self.path_to_stage_dir = path_to_stage_dir
         self.opt_algorithm = opt_algorithm
         self.target_fn = target_fn
@@ -85,12 +96,36 @@ class SequentialDriver(object):
         else:
             self.logger = logging.getLogger('gc3.gc3libs')
         self.fmt = fmt
+        self.n_workers = n_workers
 
     def de_opt(self):
         '''
         Drives optimization until convergence or `itermax` is reached.
         '''
         self.logger.debug('entering de_opt')
+        if self.n_workers and self.n_workers > 1:
+            pool = multiprocessing.Pool(self.n_workers)
+        else:
+            pool = None
+        try:
+            self._de_opt(pool)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        self.logger.debug('exiting ' + __name__)
+
+    def _eval_target(self, pop, pool):
+        '''
+        Return the values of `target_fn` over population `pop`,
+        evaluating chunks of it in `pool` if this is not `None`.
+        '''
+        if pool is None:
+            return self.target_fn(pop)
+        chunks = np.array_split(pop, self.n_workers)
+        return np.concatenate(pool.map(self.target_fn, chunks))
+
+    def _de_opt(self, pool):
         new_pop = self.opt_algorithm.pop
         has_converged = False
         while not has_converged and self.opt_algorithm.cur_iter <= self.opt_algorithm.itermax:
@@ -107,7 +142,7 @@ class SequentialDriver(object):
                     new_pop,
                     delimiter=' ')
             # EVALUATE TARGET #
-            new_vals = self.target_fn(new_pop)
+            new_vals = self._eval_target(new_pop, pool)
             if self.fmt:
                 self.logger.info(
                     "*** Population (X's) and values (Y) at iteration %d: ***",
@@ -123,15 +158,15 @@ class SequentialDriver(object):
                 tb.add_column("Y", [(self.fmt % y) for y in new_vals])
                 for line in tb.get_string().split('\n'):
                     self.logger.info(line)
-            # if __debug__:
-                #self.logger.debug('x -> f(x)')
-                # for x, fx in zip(new_pop, new_vals):
-                    #self.logger.debug('%s -> %s' % (x.tolist(), fx))
+            # only pay for `tolist()` and formatting if debug output is on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug('x -> f(x)')
+                for x, fx in zip(new_pop, new_vals):
+                    self.logger.debug('%s -> %s', x.tolist(), fx)
             self.opt_algorithm.update_opt_state(new_pop, new_vals)
             # create output
             has_converged = self.opt_algorithm.has_converged()
             new_pop = self.opt_algorithm.evolve()
-        self.logger.debug('exiting ' + __name__)
 
 
 class ParallelDriver(SequentialTaskCollection):
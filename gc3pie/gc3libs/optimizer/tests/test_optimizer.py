@@ -139,6 +139,75 @@ class TestSequentialDriver(object):
         return [x[0] + x[1] <= filter_pop_sum for x in pop]
 
 
+def _sum_of_squares(pop):
+    # module-level, so that it can be pickled to worker processes
+    return (np.asarray(pop) ** 2).sum(axis=1)
+
+
+def test_SequentialDriver_with_n_workers():
+    """Test :class:`gc3libs.optimizer.drivers.SequentialDriver` with a process pool."""
+    pop = np.random.random_sample((10, 2))
+    algo = DifferentialEvolutionAlgorithm(initial_pop=pop, itermax=3, seed=1)
+    opt = SequentialDriver(algo, target_fn=_sum_of_squares, n_workers=2)
+    opt.de_opt()
+    assert algo.cur_iter == 4
+    assert algo.vals.shape == (10,)
+    assert np.allclose(algo.vals, _sum_of_squares(algo.pop))
+
+
+def test_evolve_fn_strategies():
+    """Test that all DE strategies produce a population of the right shape."""
+    from gc3libs.optimizer.dif_evolution import strategies
+    pop = np.random.random_sample((10, 3))
+    for de_strategy in strategies:
+        for exp_cross in (False, True):
+            new_pop = DifferentialEvolutionAlgorithm.evolve_fn(
+                pop, 0.8, 0.85, 3, pop[0], de_strategy, exp_cross)
+            assert new_pop.shape == pop.shape
+
+
+def test_evolve_fn_small_population():
+    """Test that `evolve_fn` works with fewer than three population members."""
+    from gc3libs.optimizer.dif_evolution import strategies
+    for pop_size in (1, 2):
+        pop = np.random.random_sample((pop_size, 3))
+        for de_strategy in strategies:
+            new_pop = DifferentialEvolutionAlgorithm.evolve_fn(
+                pop, 0.8, 0.85, 3, pop[0], de_strategy, False)
+            assert new_pop.shape == pop.shape
+
+
+def test_populate_gives_up_after_max_n_resample():
+    """Test that `populate` stops resampling after `max_n_resample` tries."""
+    from gc3libs.optimizer import populate
+    pop = populate(create_fn=lambda: np.zeros((5, 2)),
+                   in_domain=lambda pop: [False] * len(pop),
+                   max_n_resample=3)
+    assert pop.shape == (5, 2)
+
+
+def test_populate_with_array_valued_in_domain():
+    """Test `populate` with an `in_domain` that returns a NumPy array."""
+    from gc3libs.optimizer import populate
+    rng = np.random.RandomState(1)
+    pop = populate(create_fn=lambda: rng.random_sample((20, 2)),
+                   in_domain=lambda pop: pop[:, 0] + pop[:, 1] <= 1.)
+    assert pop.shape == (20, 2)
+    assert (pop[:, 0] + pop[:, 1] <= 1.).all()
+
+
+def test_pickle_differential_evolution_algorithm():
+    """Test that `DifferentialEvolutionAlgorithm` survives pickling."""
+    import pickle
+    algo = DifferentialEvolutionAlgorithm(
+        initial_pop=np.random.random_sample((10, 2)), seed=1)
+    algo2 = pickle.loads(pickle.dumps(algo))
+    assert (algo2.pop == algo.pop).all()
+    assert algo2.de_strategy == algo.de_strategy
+    assert algo2.logger is not None
+    assert algo2.in_domain(algo2.pop).all()
+
+
 class TestParallelDriver(cli.test.FunctionalTest):
     CONF = """
 [resource/localhost_test]
@@ -167,6 +167,22 @@ class FilesystemStore(Store):
         self._save_or_replace(obj.persistent_id, obj)
         return obj.persistent_id
 
+    @same_docstring_as(Store.save_many)
+    def save_many(self, objs):
+        objs = list(objs)
+        # allocate IDs for all new objects in one go, instead of
+        # having the ID factory lock and update its state once per
+        # object
+        n_new = len([obj for obj in objs
+                     if not hasattr(obj, 'persistent_id')])
+        if n_new > 1:
+            try:
+                self.idfactory.reserve(n_new)
+            except AttributeError:
+                # no `reserve` method, ignore
+                pass
+        return [self.save(obj) for obj in objs]
+
     def _save_or_replace(self, id_, obj):
         """
         Save `obj` into file identified by `id_`; if no such
@@ -195,7 +211,7 @@ class FilesystemStore(Store):
         tgt = None
         try:
             tgt = open(filename, 'w+b')
-            pickler = make_pickler(self, tgt, obj)
+            pickler = make_pickler(self, tgt, obj, protocol=self._protocol)
             pickler.dump(obj)
             if hasattr(obj, 'changed'):
                 obj.changed = False
@@ -21,6 +21,7 @@
 __docformat__ = 'reStructuredText'
 __version__ = '$Revision$'
 
+from collections import deque
 import operator
 
 import gc3libs
@@ -135,10 +136,13 @@ class IdFactory(object):
         constructor will return one of the pre-allocated, with a
         potential speed gain if many `Id` objects are constructed in a
         loop.
+
+        The pool of pre-allocated IDs is shared by all `IdFactory`
+        instances; IDs are handed out in the order they were reserved.
         """
         assert n > 0, "Argument `n` must be a positive integer"
         IdFactory._seqno_pool.extend(self._next_id_fn(n))
-    _seqno_pool = []
+    _seqno_pool = deque()
 
     def new(self, obj):
         """
@@ -148,8 +152,8 @@ class IdFactory(object):
             prefix = obj.__class__.__name__
         else:
             prefix = self._prefix
-        if len(IdFactory._seqno_pool) > 0:
-            seqno = IdFactory._seqno_pool.pop()
+        if IdFactory._seqno_pool:
+            seqno = IdFactory._seqno_pool.popleft()
         else:
             seqno = self._next_id_fn()
         return self._idclass(prefix, seqno)
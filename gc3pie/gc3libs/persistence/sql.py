@@ -42,33 +42,55 @@ from gc3libs.persistence.serialization import make_pickler, make_unpickler
 from gc3libs.persistence.store import Store
 
 
-def sql_next_id_factory(db):
+def sql_next_id_factory(db, table_name='store'):
     """
     This function will return a function which can be used as
     `next_id_fn` argument for the `IdFactory` class constructor.
 
     `db` is DB connection class conform to DB API2.0 specs (works also
-    with SQLAlchemy engine types)
+    with SQLAlchemy engine types); `table_name` is the name of the
+    table holding the stored objects.
 
     The function returned has signature:
 
-        sql_next_id(n=1)
+        sql_next_id(n=None)
 
-    the id returned is the maximum `id` field in the `store` table plus
-    1.
+    the id returned is the maximum `id` field in the `table_name` table plus
+    1.  If `n` is a positive integer, a list of `n` consecutive IDs is
+    returned instead, at the cost of a single DB query (this is what
+    `IdFactory.reserve` expects).
+
+    IDs handed out by a previous call need not have been saved yet, so
+    the returned function also remembers the highest ID it has given
+    out and never returns it (or a lower one) again.
     """
-    def sql_next_id(n=1):
-        q = db.execute('select max(id) from store')
+    # use a list, so that the inner function can update it
+    last_id = [0]
+
+    def sql_next_id(n=None):
+        q = db.execute('select max(id) from %s' % table_name)
         nextid = q.fetchone()[0]
         if not nextid:
             nextid = 1
         else:
             nextid = int(nextid) + 1
-        return nextid
+        nextid = max(nextid, last_id[0] + 1)
+        if n is None:
+            last_id[0] = nextid
+            return nextid
+        else:
+            last_id[0] = nextid + n - 1
+            return range(nextid, nextid + n)
 
     return sql_next_id
 
 
+# maximum number of IDs in a single ``IN (...)`` clause: SQLite
+# versions before 3.32 refuse statements with more than 999 bound
+# parameters
+_MAX_IDS_PER_QUERY = 500
+
+
 class IntId(int):
 
     def __new__(cls, prefix, seqno):
@@ -161,8 +183,9 @@ class SqlStore(Store):
                         primary_key=True, nullable=False),
             sqla.Column('data',
                         sqla.BLOB()),
+            # index `state`, as it is the column queries select on
             sqla.Column('state',
-                        sqla.VARCHAR(length=128)))
+                        sqla.VARCHAR(length=128), index=True))
 
         # create internal rep of table
         self.extra_fields = dict()
@@ -171,11 +194,10 @@ class SqlStore(Store):
             table.append_column(col.copy())
             self.extra_fields[col.name] = func
 
-        current_metadata = sqla.MetaData(bind=self._engine)
-        current_metadata.reflect()
-        # check if the db exists and already has a 'store' table
-        if create and self.table_name not in current_metadata.tables:
-            self.__meta.create_all()
+        # create the table unless it exists already; this only probes
+        # for `table_name`, rather than reflecting the whole DB schema
+        if create:
+            self.__meta.create_all(checkfirst=True)
 
         self.t_store = self.__meta.tables[self.table_name]
 
@@ -183,13 +205,81 @@ class SqlStore(Store):
         if not idfactory:
             self.idfactory = IdFactory(id_class=IntId)
 
+        # build the SQL statements once; since they are executed with
+        # bound parameters, SQLAlchemy can reuse their compiled form
+        # from `self._compiled_cache` instead of re-compiling them
+        # at every invocation
+        by_id = (self.t_store.c.id == sql.bindparam('_id'))
+        self._q_list = sql.select([self.t_store.c.id])
+        self._q_exists = sql.select([self.t_store.c.id]).where(by_id)
+        self._q_load = sql.select([self.t_store.c.data]).where(by_id)
+        self._q_insert = self.t_store.insert()
+        self._q_update = self.t_store.update().where(by_id)
+        self._q_delete = self.t_store.delete().where(by_id)
+        self._compiled_cache = {}
+
+        # connection shared by all operations within a `with` block
+        self._conn = None
+        self._trans = None
+        self._depth = 0
+
+    def __enter__(self):
+        """
+        Run all operations in the `with` block within a single
+        connection and transaction, which is committed on exit (or
+        rolled back if an exception was raised).  For example::
+
+          with store:
+              for obj in objs:
+                  store.save(obj)
+
+        `with` blocks can be nested; only the outermost one commits.
+        """
+        if self._depth == 0:
+            self._conn = self._engine.connect().execution_options(
+                compiled_cache=self._compiled_cache)
+            self._trans = self._conn.begin()
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                if exc_type is None:
+                    self._trans.commit()
+                else:
+                    self._trans.rollback()
+            finally:
+                self._conn.close()
+                self._conn = None
+                self._trans = None
+        # do not swallow exceptions
+        return False
+
+    def _connect(self):
+        """
+        Return the connection to use for a DB operation: the one
+        shared within a `with` block, if any, or a new one.
+        """
+        if self._conn is not None:
+            return self._conn
+        return self._engine.connect().execution_options(
+            compiled_cache=self._compiled_cache)
+
+    def _release(self, conn):
+        """Close `conn`, unless it is shared within a `with` block."""
+        if conn is not self._conn:
+            conn.close()
+
     @same_docstring_as(Store.list)
     def list(self):
-        q = sql.select([self.t_store.c.id])
-        conn = self._engine.connect()
-        rows = conn.execute(q)
-        ids = [i[0] for i in rows.fetchall()]
-        conn.close()
+        conn = self._connect()
+        rows = conn.execute(self._q_list)
+        # iterate over the result directly, to avoid building an
+        # intermediate list of row objects
+        ids = [row[0] for row in rows]
+        self._release(conn)
         return ids
 
     @same_docstring_as(Store.replace)
@@ -203,7 +293,64 @@ class SqlStore(Store):
             obj.persistent_id = self.idfactory.new(obj)
         return self._save_or_replace(obj.persistent_id, obj)
 
-    def _save_or_replace(self, id_, obj):
+    @same_docstring_as(Store.save_many)
+    def save_many(self, objs):
+        objs = list(objs)
+        new_objs = [obj for obj in objs if not hasattr(obj, 'persistent_id')]
+        if len(new_objs) > 1:
+            # allocate all IDs at once, instead of locking the ID
+            # counter once per object
+            self.idfactory.reserve(len(new_objs))
+        for obj in new_objs:
+            obj.persistent_id = self.idfactory.new(obj)
+        # serialize everything first: pickling may recursively save
+        # `Persistable` children, each on its own connection
+        rows = [self._make_row(obj.persistent_id, obj) for obj in objs]
+        if not rows:
+            return []
+
+        conn = self._connect()
+        trans = conn.begin()
+        try:
+            ids = [row['id'] for row in rows]
+            existing = set()
+            for start in xrange(0, len(ids), _MAX_IDS_PER_QUERY):
+                q = sql.select([self.t_store.c.id]).where(
+                    self.t_store.c.id.in_(
+                        ids[start:start + _MAX_IDS_PER_QUERY]))
+                existing.update(r[0] for r in conn.execute(q))
+            # `executemany` requires all parameter sets to have the
+            # same keys, but failing extra fields are left out of a
+            # row, so group rows by the set of columns they provide
+            inserts = {}
+            updates = {}
+            for row in rows:
+                if row['id'] in existing:
+                    row['_id'] = row['id']
+                    updates.setdefault(tuple(sorted(row)), []).append(row)
+                else:
+                    inserts.setdefault(tuple(sorted(row)), []).append(row)
+            for params in inserts.itervalues():
+                conn.execute(self._q_insert, params)
+            for params in updates.itervalues():
+                conn.execute(self._q_update, params)
+            trans.commit()
+        except Exception:
+            trans.rollback()
+            raise
+        finally:
+            self._release(conn)
+
+        for obj in objs:
+            if hasattr(obj, 'changed'):
+                obj.changed = False
+        return [obj.persistent_id for obj in objs]
+
+    def _make_row(self, id_, obj):
+        """
+        Return a dictionary mapping column names to the values that
+        should be stored in the DB for object `obj`.
+        """
         fields = {'id': id_}
 
         dstdata = StringIO.StringIO()
@@ -217,7 +364,6 @@ class SqlStore(Store):
             # If we cannot determine the state of a task, consider it UNKNOWN.
             fields['state'] = Run.State.UNKNOWN
 
-        # insert into db
         for column in self.extra_fields:
             try:
                 fields[column] = self.extra_fields[column](obj)
@@ -229,46 +375,67 @@ class SqlStore(Store):
                     "Error saving DB column '%s' of object '%s': %s: %s",
                     column, obj, ex.__class__.__name__, str(ex))
 
-        q = sql.select([self.t_store.c.id]).where(self.t_store.c.id == id_)
-        conn = self._engine.connect()
-        r = conn.execute(q)
+        return fields
+
+    def _save_or_replace(self, id_, obj):
+        fields = self._make_row(id_, obj)
+
+        # insert into db
+        conn = self._connect()
+        r = conn.execute(self._q_exists, _id=id_)
         if not r.fetchone():
             # It's an insert
-            q = self.t_store.insert().values(**fields)
-            conn.execute(q)
+            conn.execute(self._q_insert, fields)
         else:
             # it's an update
-            q = self.t_store.update().where(
-                self.t_store.c.id == id_).values(**fields)
-            conn.execute(q)
+            fields['_id'] = id_
+            conn.execute(self._q_update, fields)
         obj.persistent_id = id_
         if hasattr(obj, 'changed'):
             obj.changed = False
-        conn.close()
+        self._release(conn)
 
         # return id
         return obj.persistent_id
 
     @same_docstring_as(Store.load)
     def load(self, id_):
-        q = sql.select([self.t_store.c.data]).where(self.t_store.c.id == id_)
-        conn = self._engine.connect()
-        r = conn.execute(q)
+        conn = self._connect()
+        r = conn.execute(self._q_load, _id=id_)
         rawdata = r.fetchone()
+        self._release(conn)
         if not rawdata:
             raise gc3libs.exceptions.LoadError(
                 "Unable to find any object with ID '%s'" % id_)
         unpickler = make_unpickler(self, StringIO.StringIO(rawdata[0]))
         obj = unpickler.load()
-        conn.close()
 
         return obj
 
     @same_docstring_as(Store.remove)
     def remove(self, id_):
-        conn = self._engine.connect()
-        conn.execute(self.t_store.delete().where(self.t_store.c.id == id_))
-        conn.close()
+        conn = self._connect()
+        conn.execute(self._q_delete, _id=id_)
+        self._release(conn)
+
+    @same_docstring_as(Store.remove_many)
+    def remove_many(self, ids):
+        ids = list(ids)
+        if not ids:
+            return
+        conn = self._connect()
+        trans = conn.begin()
+        try:
+            for start in xrange(0, len(ids), _MAX_IDS_PER_QUERY):
+                conn.execute(self.t_store.delete().where(
+                    self.t_store.c.id.in_(
+                        ids[start:start + _MAX_IDS_PER_QUERY])))
+            trans.commit()
+        except Exception:
+            trans.rollback()
+            raise
+        finally:
+            self._release(conn)
 
 
 # register all URLs that SQLAlchemy can handle
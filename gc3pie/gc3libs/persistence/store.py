@@ -65,6 +65,16 @@ class Store(object):
             "Abstract method 'Store.remove' called"
             " -- should have been implemented in a derived class!")
 
+    def remove_many(self, ids):
+        """
+        Delete all objects whose IDs are listed in sequence `ids`.
+
+        The default implementation just calls `remove` on each ID;
+        derived classes can override this to delete objects in bulk.
+        """
+        for id_ in ids:
+            self.remove(id_)
+
     def replace(self, id_, obj):
         """
         Replace the object already saved with the given ID with a copy
@@ -90,6 +100,16 @@ class Store(object):
             "Abstract method 'Store.save' called"
             " -- should have been implemented in a derived class!")
 
+    def save_many(self, objs):
+        """
+        Save all objects in sequence `objs`, and return the list of
+        their IDs (in the same order).
+
+        The default implementation just calls `save` on each object;
+        derived classes can override this to save objects in bulk.
+        """
+        return [self.save(obj) for obj in objs]
+
 
 class Persistable(object):
 
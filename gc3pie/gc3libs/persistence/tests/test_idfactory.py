@@ -68,6 +68,38 @@ class TestIdFactory(object):
         for i in range(len(ids)):
             assert ids[i] == "DummyObject.%d" % i
 
+    def test_reserve_order(self):
+        class next_id(object):
+
+            def __init__(self):
+                self.curid = -1
+
+            def __call__(self, n=None):
+                if n is None:
+                    self.curid += 1
+                    return self.curid
+                ids = range(self.curid + 1, self.curid + 1 + n)
+                self.curid += n
+                return ids
+
+        idfactory = IdFactory(next_id_fn=next_id())
+
+        # start from an empty pool, in case other tests left IDs there
+        saved_pool = list(IdFactory._seqno_pool)
+        IdFactory._seqno_pool.clear()
+        try:
+            idfactory.reserve(3)
+            idfactory.reserve(2)
+            dummy = DummyObject()
+            ids = [idfactory.new(dummy) for i in range(6)]
+        finally:
+            IdFactory._seqno_pool.clear()
+            IdFactory._seqno_pool.extend(saved_pool)
+
+        # reserved IDs come first, in the order they were reserved
+        for i in range(len(ids)):
+            assert ids[i] == "DummyObject.%d" % i
+
 
 # main: run tests
 
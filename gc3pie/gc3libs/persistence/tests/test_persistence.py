@@ -198,11 +198,41 @@ class GenericStoreChecks(object):
     def test_list_method(self):
         """Test the `list` method of the `SqlStore` class"""
         num_objs = 10
-        for i in range(num_objs):
-            self.store.save(SimplePersistableObject('Object %d' % i))
+        self.store.save_many(
+            [SimplePersistableObject('Object %d' % i) for i in range(num_objs)])
 
         assert len(self.store.list()) == num_objs
 
+    def test_save_many_method(self):
+        """Test the `save_many` method of a generic `Store` class"""
+        objs = [SimplePersistableObject(str(i)) for i in range(5)]
+        # save one object beforehand, so `save_many` has to update it
+        id0 = self.store.save(objs[0])
+        objs[0].value = 'updated'
+        ids = self.store.save_many(objs)
+        assert len(ids) == len(set(ids)) == 5
+        assert ids[0] == id0
+        assert len(self.store.list()) == 5
+        assert self.store.load(ids[0]).value == 'updated'
+        for i in range(1, 5):
+            assert self.store.load(ids[i]).value == str(i)
+
+    def test_save_many_with_generator(self):
+        """Test that `save_many` accepts any iterable, not just lists."""
+        ids = self.store.save_many(
+            SimplePersistableObject(str(i)) for i in range(3))
+        assert len(ids) == len(set(ids)) == 3
+        assert_equal(sorted(self.store.list()), sorted(ids))
+        for i in range(3):
+            assert self.store.load(ids[i]).value == str(i)
+
+    def test_remove_many_method(self):
+        """Test the `remove_many` method of a generic `Store` class"""
+        ids = self.store.save_many(
+            [SimplePersistableObject(str(i)) for i in range(5)])
+        self.store.remove_many(ids[:3])
+        assert_equal(sorted(self.store.list()), sorted(ids[3:]))
+
     @raises(gc3libs.exceptions.LoadError)
     def test_remove_method(self):
         """
@@ -345,6 +375,38 @@ class TestFilesystemStore(GenericStoreChecks):
         assert obj2.value == 'children'
         assert obj1.children == obj2
 
+    def test_filesystemstore_protocol(self):
+        """
+        Check that `FilesystemStore` uses the requested pickle protocol.
+        """
+        from gc3libs.persistence.filesystem import FilesystemStore
+        store = FilesystemStore(self.tmpdir, protocol=0)
+        id_ = store.save(SimplePersistableObject('GC3'))
+        data = open(os.path.join(self.tmpdir, str(id_)), 'rb').read()
+        # protocol 2 pickles start with the PROTO opcode
+        assert not data.startswith('\x80')
+        assert store.load(id_).value == 'GC3'
+
+    def test_filesystemstore_save_many_reserves_ids(self):
+        """
+        Check that `FilesystemStore.save_many` allocates all new IDs at once.
+        """
+        from gc3libs.persistence.filesystem import FilesystemStore
+        from gc3libs.persistence.idfactory import IdFactory
+        calls = []
+
+        def next_id(n=None):
+            calls.append(n)
+            if n is None:
+                return 1000 + len(calls)
+            return range(2000, 2000 + n)
+        store = FilesystemStore(self.tmpdir,
+                                idfactory=IdFactory(next_id_fn=next_id))
+        ids = store.save_many([SimplePersistableObject(n) for n in range(5)])
+        assert calls == [5]
+        assert len(set(ids)) == 5
+        assert sorted(store.load(id_).value for id_ in ids) == range(5)
+
     def test_disaggregate_persistable_objects(self):
         """
         Check that `Persistable` instances are saved separately from
@@ -396,6 +458,80 @@ class SqlStoreChecks(GenericStoreChecks):
 
         assert row[0] == app.execution.state
 
+    def test_sql_next_id_factory_reserve(self):
+        """Test that `sql_next_id_factory` can pre-allocate IDs."""
+        from gc3libs.persistence.sql import sql_next_id_factory
+        id0 = self.store.save(SimplePersistableObject('GC3'))
+        next_id = sql_next_id_factory(self.conn, self.store.table_name)
+        assert_equal(next_id(), id0 + 1)
+        # `id0 + 1` has been handed out, even if not saved yet
+        assert_equal(next_id(3), [id0 + 2, id0 + 3, id0 + 4])
+
+    def test_sql_next_id_factory_reserve_twice(self):
+        """Test that two `reserve` calls in a row give distinct IDs."""
+        from gc3libs.persistence.sql import IntId, sql_next_id_factory
+        self.store.save(SimplePersistableObject('GC3'))
+        idfactory = IdFactory(
+            next_id_fn=sql_next_id_factory(self.conn, self.store.table_name),
+            id_class=IntId)
+        # start from an empty pool, in case other tests left IDs there
+        saved_pool = list(IdFactory._seqno_pool)
+        IdFactory._seqno_pool.clear()
+        try:
+            idfactory.reserve(3)
+            idfactory.reserve(2)
+            ids = [idfactory.new(None) for _ in range(5)]
+        finally:
+            IdFactory._seqno_pool.clear()
+            IdFactory._seqno_pool.extend(saved_pool)
+        assert_equal(len(set(ids)), 5)
+        assert_equal(ids, sorted(ids))
+
+    def test_sql_save_many_in_chunks(self):
+        """Test `save_many` when IDs span several ``IN (...)`` queries."""
+        import gc3libs.persistence.sql
+        objs = [SimplePersistableObject(str(i)) for i in range(5)]
+        self.store.save(objs[1])
+        self.store.save(objs[3])
+        objs[1].value = 'updated'
+        max_ids = gc3libs.persistence.sql._MAX_IDS_PER_QUERY
+        gc3libs.persistence.sql._MAX_IDS_PER_QUERY = 2
+        try:
+            ids = self.store.save_many(objs)
+        finally:
+            gc3libs.persistence.sql._MAX_IDS_PER_QUERY = max_ids
+        assert_equal(sorted(self.store.list()), sorted(ids))
+        assert_equal(self.store.load(ids[1]).value, 'updated')
+        assert_equal(self.store.load(ids[4]).value, '4')
+
+    def test_sql_remove_many_in_chunks(self):
+        """Test `remove_many` when IDs span several ``IN (...)`` queries."""
+        import gc3libs.persistence.sql
+        ids = self.store.save_many(
+            [SimplePersistableObject(str(i)) for i in range(7)])
+        max_ids = gc3libs.persistence.sql._MAX_IDS_PER_QUERY
+        gc3libs.persistence.sql._MAX_IDS_PER_QUERY = 2
+        try:
+            self.store.remove_many(ids[:5])
+        finally:
+            gc3libs.persistence.sql._MAX_IDS_PER_QUERY = max_ids
+        assert_equal(sorted(self.store.list()), sorted(ids[5:]))
+
+    def test_sql_with_block_is_a_transaction(self):
+        """Test that a `with` block on a `SqlStore` commits or rolls back."""
+        with self.store:
+            id1 = self.store.save(SimplePersistableObject('one'))
+            id2 = self.store.save(SimplePersistableObject('two'))
+        assert_equal(sorted(self.store.list()), sorted([id1, id2]))
+
+        try:
+            with self.store:
+                self.store.save(SimplePersistableObject('three'))
+                raise RuntimeError()
+        except RuntimeError:
+            pass
+        assert_equal(sorted(self.store.list()), sorted([id1, id2]))
+
     # the `jobname` attribute is optional in the `Application` ctor
     def test_persist_Application_with_no_job_name(self):
         app = gc3libs.Application(
@@ -582,6 +718,27 @@ class TestSqliteStore(SqlStoreChecks):
     def _make_store(self, **kwargs):
         return make_store(self.db_url, **kwargs)
 
+    def test_sqlite_memory_stores_are_isolated(self):
+        """Test that each in-memory SQLite store has its own DB."""
+        store1 = SqlStore('sqlite://')
+        store2 = SqlStore('sqlite://')
+        store1.save(SimplePersistableObject('GC3'))
+        assert_equal(len(store1.list()), 1)
+        assert_equal(store2.list(), [])
+
+
+def test_load_old_format_IntId():
+    """Test that `IntId` objects pickled with a `__dict__` can be loaded."""
+    import cPickle
+    from gc3libs.persistence.sql import IntId
+    # `cPickle.dumps(IntId(None, 42), 2)`: the empty `{}` is the
+    # instance `__dict__`, stored as the object state
+    old = ('\x80\x02cgc3libs.persistence.sql\nIntId\nq\x01NK*\x86\x81q\x02'
+           '}q\x03b.')
+    id_ = cPickle.loads(old)
+    assert isinstance(id_, IntId)
+    assert_equal(id_, 42)
+
 
 class TestSqliteStoreWithAlternateTable(TestSqliteStore):
 
@@ -262,9 +262,12 @@ class Session(list):
         ids_out = open(os.path.join(self.path, Session.INDEX_FILENAME), 'w')
         ids_in = open(index_csv, 'r')
         try:
-            for row in csv.DictReader(ids_in, ['jobname', 'persistent_id',
-                                               'state', 'info']):
-                ids_out.write(row['persistent_id'])
+            # columns are: jobname, persistent_id, state, info
+            for row in csv.reader(ids_in):
+                if len(row) < 2:
+                    # skip blank lines, like `csv.DictReader` would
+                    continue
+                ids_out.write(row[1])
                 ids_out.write('\n')
             ids_out.close()
             ids_in.close()
@@ -366,13 +369,8 @@ class Session(list):
             self.store_url, **extra_args)
 
         idx_filename = os.path.join(self.path, self.INDEX_FILENAME)
-        try:
-            idx_fd = open(idx_filename)
+        with open(idx_filename) as idx_fd:
             ids = idx_fd.read().split()
-            idx_fd.close()
-        except:
-            idx_fd.close()
-            raise
 
         try:
             start_file = os.path.join(
@@ -591,9 +589,8 @@ class Session(list):
         """
         Save all modified tasks to persistent storage.
         """
-        for task in self.tasks.itervalues():
-            if task.changed:
-                self.save(task)
+        self.store.save_many(
+            [task for task in self.tasks.itervalues() if task.changed])
         if flush:
             self.flush()
 
@@ -31,80 +31,11 @@ __docformat__ = 'reStructuredText'
 __version__ = 'development version (SVN $Revision$)'
 
 
+# `SetProductIterator` is kept as an alias for backwards compatibility
+from itertools import product as SetProductIterator
 import string
 
 
-try:
-    import itertools
-    SetProductIterator = itertools.product
-except:
-    # use our own implementation, in case `itertools` does not (yet)
-    # provide the set-product
-    class SetProductIterator(object):
-
-        """Iterate over all elements in a cartesian product.
-
-        Argument `factors` is a sequence, all whose items are sequences
-        themselves: the returned iterator will return -upon each
-        successive invocation- a list `[t_1, t_2, ..., t_n]` where `t_k`
-        is an item in the `k`-th sequence.
-
-        Examples::
-          >>> list(SetProductIterator([]))
-          [[]]
-          >>> list(SetProductIterator([1]))
-          [[1]]
-          >>> list(SetProductIterator([1],[1]))
-          [[1, 1]]
-          >>> list(SetProductIterator([1,2],[]))
-          [[]]
-          >>> list(SetProductIterator([1,2],[1]))
-          [[1, 1], [2, 1]]
-          >>> list(SetProductIterator([1, 2], [1, 2]))
-          [[1, 1], [2, 1], [1, 2], [2, 2]]
-        """
-
-        def __init__(self, *factors):
-            self.__closed = False
-            self.__factors = factors
-            self.__L = len(factors)
-            self.__M = [len(s) - 1 for s in factors]
-            self.__m = [0] * self.__L
-            self.__i = 0
-
-        def __iter__(self):
-            return self
-
-        def next(self):
-            if self.__closed:
-                raise StopIteration
-            if (0 == self.__L) or (-1 in self.__M):
-                # there are no factors, or one of them has no elements
-                self.__closed = True
-                return []
-            else:
-                if self.__i < self.__L:
-                    # will return element corresponding to current multi-index
-                    result = [s[self.__m[i]]
-                              for (i, s) in enumerate(self.__factors)]
-                    # advance multi-index
-                    i = 0
-                    while (i < self.__L):
-                        if self.__m[i] == self.__M[i]:
-                            self.__m[i] = 0
-                            i += 1
-                        else:
-                            self.__m[i] += 1
-                            break
-                    self.__i = i
-                    # back to caller
-                    return result
-                else:
-                    # at end of iteration
-                    self.__closed = True
-                    raise StopIteration
-
-
 class Template(object):
 
     """
@@ -125,6 +56,8 @@ class Template(object):
         self._template = template
         self._keywords = extra_args
         self._valid = validator
+        # lazily-built `string.Template`, see `substitute`
+        self._compiled = None
 
     def substitute(self, **extra_args):
         """
@@ -147,8 +80,13 @@ class Template(object):
             try:
                 return self._template.substitute(**keywords)
             except AttributeError:
-                return string.Template(
-                    str(self._template)).safe_substitute(keywords)
+                # `Template` objects pickled before `_compiled` was
+                # introduced do not have the attribute at all
+                compiled = getattr(self, '_compiled', None)
+                if compiled is None:
+                    compiled = string.Template(str(self._template))
+                    self._compiled = compiled
+                return compiled.safe_substitute(keywords)
         else:
             raise ValueError("Invalid substitution values in template.")
 
@@ -264,12 +202,11 @@ def expansions(obj, **extra_args):
     if isinstance(obj, dict):
         keys = tuple(obj.keys())  # fix a key order
         for items in SetProductIterator(
-                *[list(expansions(obj[keys[i]], **extra_args))
-                  for i in range(len(keys))]):
-            yield dict((keys[i], items[i]) for i in range(len(keys)))
+                *[expansions(obj[key], **extra_args) for key in keys]):
+            yield dict(zip(keys, items))
     elif isinstance(obj, tuple):
         for items in SetProductIterator(
-                *[list(expansions(u, **extra_args)) for u in obj]):
+                *[expansions(u, **extra_args) for u in obj]):
             yield tuple(items)
     elif isinstance(obj, list):
         for item in obj:
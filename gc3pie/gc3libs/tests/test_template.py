@@ -0,0 +1,54 @@
+#! /usr/bin/env python
+#
+"""
+Test for classes and functions in the `template` module.
+"""
+# Copyright (C) 2012, 2013, GC3, University of Zurich. All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
+#
+__docformat__ = 'reStructuredText'
+__version__ = '$Revision$'
+
+# stdlib imports
+import cPickle
+
+# 3rd party imports
+from nose.tools import assert_equal
+
+# GC3Pie imports
+from gc3libs.template import Template
+
+
+# test definitions
+
+def test_unpickle_old_format_Template():
+    """Test that `Template` objects pickled without `_compiled` still work."""
+    tmpl = Template("a=${a}", bool, a=1)
+    # this is how `Template` objects were pickled before the
+    # `_compiled` attribute was introduced
+    del tmpl.__dict__['_compiled']
+    old = cPickle.dumps(tmpl, 2)
+    tmpl2 = cPickle.loads(old)
+    assert not hasattr(tmpl2, '_compiled')
+    assert_equal(tmpl2.substitute(), "a=1")
+    assert_equal(tmpl2.substitute(a=2), "a=2")
+
+
+# main: run tests
+
+if "__main__" == __name__:
+    import nose
+    nose.runmodule()
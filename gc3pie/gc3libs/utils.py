@@ -39,6 +39,7 @@ import shutil
 import sys
 import tempfile
 import time
+import warnings
 import cStringIO as StringIO
 import UserDict
 
@@ -94,17 +95,13 @@ def backup(path):
 
     """
     parent_dir = (os.path.dirname(path) or os.getcwd())
-    prefix = os.path.basename(path) + '.~'
-    p = len(prefix)
+    # match existing backups; non-numeric suffixes are ignored
+    backup_name = re.compile(re.escape(os.path.basename(path)) + r'\.~(\d+)~$')
     suffix = 1
-    for name in [entry for entry in os.listdir(parent_dir)
-                 if (entry.startswith(prefix) and entry.endswith('~'))]:
-        try:
-            n = int(name[p:-1])
-            suffix = max(suffix, n + 1)
-        except ValueError:
-            # ignore non-numeric suffixes
-            pass
+    for entry in os.listdir(parent_dir):
+        match = backup_name.match(entry)
+        if match:
+            suffix = max(suffix, int(match.group(1)) + 1)
     new_path = "%s.~%d~" % (path, suffix)
     os.rename(path, new_path)
     return new_path
@@ -443,7 +440,13 @@ class Enum(frozenset):
       DOG
     """
     def __new__(cls, *args):
-        return frozenset.__new__(cls, args)
+        instance = frozenset.__new__(cls, args)
+        # store labels as instance attributes, so that looking them
+        # up is a plain attribute access and does not go through
+        # `__getattr__` (which is invoked only for unknown names);
+        # `__setattr__` is disabled, so write to `__dict__` directly
+        instance.__dict__.update((label, label) for label in args)
+        return instance
 
     def __getattr__(self, name):
         if name in self:
@@ -519,17 +522,22 @@ def first(seq):
       >>> s = {'a':1, 'b':2, 'c':3}
       >>> first(sorted(s.keys()))
       'a'
+
+    Empty sequences are rejected as well::
+
+      >>> first([])
+      Traceback (most recent call last):
+        ...
+      TypeError: Argument to `first()` method needs to be a non-empty iterator or sequence.
     """
-    try:  # try iterator interface
-        return seq.next()
-    except AttributeError:
-        pass
-    try:  # seq is no iterator, try indexed lookup
-        return seq[0]
-    except IndexError:
-        pass
-    raise TypeError(
-        "Argument to `first()` method needs to be iterator or sequence.")
+    # `iter()` returns iterators unchanged, and falls back to indexed
+    # lookup for sequences; it raises `TypeError` on anything else
+    try:
+        return next(iter(seq))
+    except StopIteration:
+        raise TypeError(
+            "Argument to `first()` method needs to be"
+            " a non-empty iterator or sequence.")
 
 
 def fgrep(literal, filename):
@@ -550,19 +558,20 @@ def from_template(template, **extra_args):
 
     If `template` is an object providing a `read()` method, that is
     used to gather the template contents; else, if a file named
-    `template` exists, the template contents are read from it;
-    otherwise, `template` is treated like a string providing the
-    template contents itself.
+    `template` can be opened for reading, the template contents are
+    read from it; otherwise, `template` is treated like a string
+    providing the template contents itself.
     """
     if hasattr(template, 'read') and callable(template.read):
         template_contents = template.read()
-    elif os.path.exists(template):
-        template_file = file(template, 'r')
-        template_contents = template_file.read()
-        template_file.close()
     else:
-        # treat `template` as a string
-        template_contents = template
+        try:
+            with open(template, 'r') as template_file:
+                template_contents = template_file.read()
+        except (IOError, OSError, TypeError):
+            # not a readable file (or a directory): treat `template`
+            # as a string
+            template_contents = template
     # substitute `extra_args` into `t` and return it
     return (template_contents % extra_args)
 
@@ -580,11 +589,23 @@ def getattr_nested(obj, name):
         return getattr_nested(getattr(obj, first), rest)
 
 
+# characters that have a special meaning in regular expressions
+_RE_SPECIAL_CHARS = frozenset('.^$*+?{}[]\\|()')
+
+
 def grep(pattern, filename):
     """
     Iterate over all lines in a file that match the `pattern` regular
     expression.
+
+    If `pattern` contains no regular expression special characters,
+    then lines are matched by plain substring search, as `fgrep`:func:
+    does.
     """
+    if _RE_SPECIAL_CHARS.isdisjoint(pattern):
+        for line in fgrep(pattern, filename):
+            yield line
+        return
     rx = re.compile(pattern)
     with open(filename, 'r') as file:
         for line in file:
@@ -606,7 +627,14 @@ def ifelse(test, if_true, if_false):
       >>> b = ifelse(not a, 'yay', 'nope'); print b
       nope
 
+    .. deprecated:: 2.3
+       Use the conditional expression ``if_true if test else if_false``
+       instead: it avoids a function call and only evaluates the
+       branch that is actually taken.
     """
+    warnings.warn("`gc3libs.utils.ifelse` is deprecated;"
+                  " use a conditional expression instead.",
+                  DeprecationWarning, stacklevel=2)
     if test:
         return if_true
     else:
@@ -752,10 +780,10 @@ class History(object):
         Return text of last message appended.
         If log is empty, return empty string.
         """
-        if len(self._messages) == 0:
-            return ''
-        else:
+        try:
             return self.format_message(self._messages[-1])
+        except IndexError:
+            return ''
 
     def format_message(self, message):
         """Return a formatted message, appending to the message its timestamp
@@ -772,13 +800,13 @@ class History(object):
 
     def __iter__(self):
         """Iterate over messages in the temporal order they were added."""
-        return iter([self.format_message(record) for record in self._messages])
+        return (self.format_message(record) for record in self._messages)
 
     def __str__(self):
         """Return all messages texts in a single string, separated by newline
         characters."""
-        return str.join('\n', [self.format_message(record)
-                               for record in self._messages])
+        return str.join('\n', (self.format_message(record)
+                               for record in self._messages))
 
 
 def mkdir(path, mode=0o777):
@@ -1305,11 +1333,10 @@ class PlusInfinity(Singleton):
 
     """
 
+    # since `PlusInfinity` is a singleton, an identity test is all
+    # that is needed to tell whether `other` is infinity as well
     def __gt__(self, other):
-        if self is other:
-            return False
-        else:
-            return True
+        return self is not other
 
     def __ge__(self, other):
         return True
@@ -1318,19 +1345,13 @@ class PlusInfinity(Singleton):
         return False
 
     def __le__(self, other):
-        if self is other:
-            return True
-        else:
-            return False
+        return self is other
 
     def __eq__(self, other):
-        if self is other:
-            return True
-        else:
-            return False
+        return self is other
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        return self is not other
 
 
 # In Python 2.7 still, `DictMixin` is an old-style class; thus, we need
@@ -1368,6 +1389,13 @@ class Struct(object, UserDict.DictMixin):
       >>> b.z
       3
 
+    Membership tests and iteration work as with `dict` instances::
+
+      >>> 'z' in a
+      True
+      >>> sorted(a.items())
+      [('z', 3)]
+
     """
 
     def __init__(self, initializer=None, **extra_args):
@@ -1398,6 +1426,38 @@ class Struct(object, UserDict.DictMixin):
     def keys(self):
         return self.__dict__.keys()
 
+    # `DictMixin` would synthesize the following methods in Python out
+    # of `keys` and `__getitem__`; delegate them to the `__dict__`
+    # methods instead, which are implemented in C.
+    def __contains__(self, name):
+        return name in self.__dict__
+
+    has_key = __contains__
+
+    def __iter__(self):
+        return iter(self.__dict__)
+
+    def __len__(self):
+        return len(self.__dict__)
+
+    def get(self, name, default=None):
+        return self.__dict__.get(name, default)
+
+    def items(self):
+        return self.__dict__.items()
+
+    def iteritems(self):
+        return self.__dict__.iteritems()
+
+    def iterkeys(self):
+        return self.__dict__.iterkeys()
+
+    def itervalues(self):
+        return self.__dict__.itervalues()
+
+    def values(self):
+        return self.__dict__.values()
+
 
 def string_to_boolean(word):
     """
@@ -1438,10 +1498,11 @@ def string_to_boolean(word):
       False
 
     """
-    if word.strip().lower() in ['true', 'yes', 'on', '1']:
-        return True
-    else:
-        return False
+    return word.strip().lower() in _TRUE_WORDS
+
+
+# words that `string_to_boolean` recognizes as meaning `True`
+_TRUE_WORDS = frozenset(['true', 'yes', 'on', '1'])
 
 
 def stripped(iterable):
@@ -1514,16 +1575,16 @@ def test_file(path, mode, exception=RuntimeError, isdir=False):
     """
     if not os.access(path, os.F_OK):
         raise exception("Cannot access %s '%s'."
-                        % (ifelse(isdir, "directory", "file"), path))
+                        % ("directory" if isdir else "file", path))
     if isdir and not os.path.isdir(path):
         raise exception(
             "Expected '%s' to be a directory, but it's not." % path)
     if (mode & os.R_OK) and not os.access(path, os.R_OK):
         raise exception("Cannot read %s '%s'."
-                        % (ifelse(isdir, "directory", "file"), path))
+                        % ("directory" if isdir else "file", path))
     if (mode & os.W_OK) and not os.access(path, os.W_OK):
         raise exception("Cannot write to %s '%s'."
-                        % (ifelse(isdir, "directory", "file"), path))
+                        % ("directory" if isdir else "file", path))
     if (mode & os.X_OK) and not os.access(path, os.X_OK):
         if isdir:
             raise exception("Cannot traverse directory '%s':"
@@ -1577,22 +1638,18 @@ def to_bytes(s):
     # convert the substring of `s` that does not include the suffix
     if unit.isdigit():
         return int(s[0:(last + 1)])
-    if unit == 'k':
-        return int(float(s[0:last]) * k)
-    if unit == 'm':
-        return int(float(s[0:last]) * k * k)
-    if unit == 'g':
-        return int(float(s[0:last]) * k * k * k)
-    if unit == 't':
-        return int(float(s[0:last]) * k * k * k * k)
-    if unit == 'p':
-        return int(float(s[0:last]) * k * k * k * k * k)
-    if unit == 'e':
-        return int(float(s[0:last]) * k * k * k * k * k * k)
-    if unit == 'z':
-        return int(float(s[0:last]) * k * k * k * k * k * k * k)
-    if unit == 'y':
-        return int(float(s[0:last]) * k * k * k * k * k * k * k * k)
+    try:
+        return int(float(s[0:last]) * _TO_BYTES_MULTIPLIERS[k][unit])
+    except KeyError:
+        # unknown suffix
+        return None
+
+
+# multipliers for the suffixes accepted by `to_bytes`, indexed by the
+# base of the unit (1000 for SI units, 1024 for binary ones)
+_TO_BYTES_MULTIPLIERS = dict(
+    (base, dict((unit, base ** (n + 1)) for n, unit in enumerate('kmgtpezy')))
+    for base in (1000, 1024))
 
 
 def send_mail(send_from, send_to, subject, text, files=[], server="localhost"):
@@ -1614,7 +1671,8 @@ def send_mail(send_from, send_to, subject, text, files=[], server="localhost"):
 
     for f in files:
         part = MIMEBase('application', "octet-stream")
-        part.set_payload(open(f, "rb").read())
+        with open(f, "rb") as attachment:
+            part.set_payload(attachment.read())
         Encoders.encode_base64(part)
         part.add_header('Content-Disposition',
                         'attachment; filename="%s"' % os.path.basename(f))